@@ -2,14 +2,78 @@
 
 from __future__ import annotations
 
+import os
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-console = Console()
+    from rich.console import Console
+
+
+# Rich markup tags such as [bold], [red bold] and [/cyan]
+_MARKUP_RE = re.compile(r"\[/?[a-z][a-z ]*\]|\[/\]")
+
+# agent.yaml metadata shown by `info`; scaffolded manifests keep it above _HEADER_MARKER
+_INFO_FIELDS = ("name", "version", "description", "category", "author", "model", "dependencies")
+_HEADER_MARKER = b"\n# ---"
+
+_HELP = (
+    "[bold green]iEvo SDK[/bold green] — developer toolkit for building agents\n\n"
+    "Commands:\n"
+    "  [bold]new[/bold] <name>       Scaffold a new agent package\n"
+    "  [bold]validate[/bold] <dir>   Validate an agent package\n"
+    "  [bold]info[/bold] <dir>       Show agent package info\n"
+    "  [bold]--version[/bold]        Show version"
+)
+
+
+@lru_cache(maxsize=1)
+def _use_rich() -> bool:
+    """Use Rich only on a terminal; pipes and CI get plain text without importing it."""
+    return sys.stdout.isatty()
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Return the shared Rich console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _print(msg: str = "") -> None:
+    """Print a Rich markup string, stripping the markup when not on a terminal."""
+    if _use_rich():
+        _get_console().print(msg)
+    else:
+        sys.stdout.write(_MARKUP_RE.sub("", msg) + "\n")
+
+
+def _print_table(title: str, rows: list[tuple[str, str]]) -> None:
+    """Print label/value rows as a Rich table, or as aligned plain text."""
+    if not _use_rich():
+        width = max(len(label) for label, _ in rows)
+        lines = [title] + [f"  {label.ljust(width)}  {value}" for label, value in rows]
+        sys.stdout.write("\n" + "\n".join(lines) + "\n\n")
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title, show_header=False, padding=(0, 2))
+    table.add_column(style="bold")
+    table.add_column()
+    for label, value in rows:
+        table.add_row(label, value)
+
+    console = _get_console()
+    console.print()
+    console.print(table)
+    console.print()
 
 
 def main() -> None:
@@ -22,53 +86,51 @@ def main() -> None:
 
     cmd = args[0]
 
-    if cmd == "new":
-        _cmd_new(args[1:])
-    elif cmd == "validate":
-        _cmd_validate(args[1:])
-    elif cmd == "info":
-        _cmd_info(args[1:])
-    elif cmd == "--version":
+    if cmd == "--version":
         from ievo_sdk import __version__
-        console.print(f"ievo-sdk {__version__}")
-    else:
-        console.print(f"[red]Unknown command: {cmd}[/red]")
+        sys.stdout.write(f"ievo-sdk {__version__}\n")
+        return
+
+    handler = _COMMANDS.get(cmd)
+    if handler is None:
+        _print(f"[red]Unknown command: {cmd}[/red]")
         _show_help()
         sys.exit(1)
 
+    handler(args[1:])
+
 
 def _show_help() -> None:
     """Display help."""
-    console.print(Panel.fit(
-        "[bold green]iEvo SDK[/bold green] — developer toolkit for building agents\n\n"
-        "Commands:\n"
-        "  [bold]new[/bold] <name>       Scaffold a new agent package\n"
-        "  [bold]validate[/bold] <dir>   Validate an agent package\n"
-        "  [bold]info[/bold] <dir>       Show agent package info\n"
-        "  [bold]--version[/bold]        Show version",
-        title="ievo-sdk",
-    ))
+    if not _use_rich():
+        _print(_HELP)
+        return
+
+    from rich.panel import Panel
+
+    _get_console().print(Panel.fit(_HELP, title="ievo-sdk"))
 
 
 def _cmd_new(args: list[str]) -> None:
     """Scaffold a new agent."""
     if not args:
-        console.print("[red]Usage: ievo-sdk new <name> [--dir <output>][/red]")
+        _print("[red]Usage: ievo-sdk new <name> [--dir <output>][/red]")
         sys.exit(1)
 
     name = args[0]
     output_dir = Path(".")
 
     # Parse --dir
-    if "--dir" in args:
-        idx = args.index("--dir")
-        if idx + 1 < len(args):
-            output_dir = Path(args[idx + 1])
+    for idx, arg in enumerate(args):
+        if arg == "--dir":
+            if idx + 1 < len(args):
+                output_dir = Path(args[idx + 1])
+            break
 
     from ievo_sdk.scaffold import scaffold_agent
     from ievo_sdk.scaffold.generator import AgentSpec
 
-    console.print(f"\n[bold]Scaffolding agent:[/bold] {name}\n")
+    _print(f"\n[bold]Scaffolding agent:[/bold] {name}\n")
 
     # Interactive prompts
     description = _prompt("Description", f"A custom {name} agent")
@@ -85,16 +147,16 @@ def _cmd_new(args: list[str]) -> None:
     )
 
     agent_dir = scaffold_agent(spec, output_dir)
-    console.print(f"\n[green]✓[/green] Agent created at [bold]{agent_dir}[/bold]")
-    console.print(f"  Edit [cyan]ROLE.md[/cyan] to define behavior")
-    console.print(f"  Edit [cyan]agent.yaml[/cyan] to configure settings")
-    console.print(f"  Run [cyan]ievo-sdk validate {agent_dir}[/cyan] to check\n")
+    _print(f"\n[green]✓[/green] Agent created at [bold]{agent_dir}[/bold]")
+    _print(f"  Edit [cyan]ROLE.md[/cyan] to define behavior")
+    _print(f"  Edit [cyan]agent.yaml[/cyan] to configure settings")
+    _print(f"  Run [cyan]ievo-sdk validate {agent_dir}[/cyan] to check\n")
 
 
 def _cmd_validate(args: list[str]) -> None:
     """Validate an agent package."""
     if not args:
-        console.print("[red]Usage: ievo-sdk validate <agent-dir>[/red]")
+        _print("[red]Usage: ievo-sdk validate <agent-dir>[/red]")
         sys.exit(1)
 
     agent_dir = Path(args[0])
@@ -104,73 +166,97 @@ def _cmd_validate(args: list[str]) -> None:
     result = validate_agent(agent_dir)
 
     if result.errors:
-        console.print(f"\n[red bold]✗ Validation failed[/red bold] — {len(result.errors)} error(s)\n")
+        _print(f"\n[red bold]✗ Validation failed[/red bold] — {len(result.errors)} error(s)\n")
         for e in result.errors:
-            console.print(f"  [red]✗[/red] {e}")
+            _print(f"  [red]✗[/red] {e}")
     else:
-        console.print(f"\n[green bold]✓ Valid agent package[/green bold]\n")
+        _print(f"\n[green bold]✓ Valid agent package[/green bold]\n")
 
     if result.warnings:
         for w in result.warnings:
-            console.print(f"  [yellow]⚠[/yellow] {w}")
+            _print(f"  [yellow]⚠[/yellow] {w}")
 
     if result.info:
         for i in result.info:
-            console.print(f"  [dim]ℹ {i}[/dim]")
+            _print(f"  [dim]ℹ {i}[/dim]")
 
-    console.print()
+    _print()
     sys.exit(0 if result.valid else 1)
 
 
 def _cmd_info(args: list[str]) -> None:
     """Show agent package info."""
     if not args:
-        console.print("[red]Usage: ievo-sdk info <agent-dir>[/red]")
+        _print("[red]Usage: ievo-sdk info <agent-dir>[/red]")
         sys.exit(1)
 
     agent_dir = Path(args[0])
     yaml_path = agent_dir / "agent.yaml"
 
     if not yaml_path.exists():
-        console.print(f"[red]No agent.yaml in {agent_dir}[/red]")
+        _print(f"[red]No agent.yaml in {agent_dir}[/red]")
         sys.exit(1)
 
-    import yaml
-    data = yaml.safe_load(yaml_path.read_text())
-
-    table = Table(title=f"Agent: {data.get('name', '?')}", show_header=False, padding=(0, 2))
-    table.add_column(style="bold")
-    table.add_column()
+    data = _load_agent_info(yaml_path)
 
-    table.add_row("Version", data.get("version", "?"))
-    table.add_row("Description", data.get("description", ""))
-    table.add_row("Category", data.get("category", "?"))
-    table.add_row("Author", data.get("author", "?"))
+    rows = [
+        ("Version", data.get("version", "?")),
+        ("Description", data.get("description", "")),
+        ("Category", data.get("category", "?")),
+        ("Author", data.get("author", "?")),
+    ]
 
     model = data.get("model", {})
     if isinstance(model, dict):
         model_str = model.get("primary", "?")
         if model.get("fallback"):
             model_str += f" → {model['fallback']}"
-        table.add_row("Model", model_str)
+        rows.append(("Model", model_str))
 
     deps = data.get("dependencies", [])
-    table.add_row("Dependencies", ", ".join(deps) if deps else "none")
-
-    # File inventory
-    files = list(agent_dir.rglob("*"))
-    md_files = [f for f in files if f.suffix == ".md"]
-    yaml_files = [f for f in files if f.suffix in (".yaml", ".yml")]
-    table.add_row("Files", f"{len(files)} total ({len(md_files)} .md, {len(yaml_files)} .yaml)")
+    rows.append(("Dependencies", ", ".join(deps) if deps else "none"))
+
+    # File inventory — one scandir-backed walk, no per-entry stat
+    total = md_count = yaml_count = 0
+    for _, _, filenames in os.walk(agent_dir):
+        for filename in filenames:
+            total += 1
+            suffix = os.path.splitext(filename)[1]
+            if suffix == ".md":
+                md_count += 1
+            elif suffix in (".yaml", ".yml"):
+                yaml_count += 1
+    rows.append(("Files", f"{total} total ({md_count} .md, {yaml_count} .yaml)"))
 
     evo_log = agent_dir / "EVOLUTION_LOG.md"
     if evo_log.exists():
         evo_count = evo_log.read_text().count("\n## ")
-        table.add_row("Evolutions", str(evo_count) if evo_count else "none yet")
+        rows.append(("Evolutions", str(evo_count) if evo_count else "none yet"))
 
-    console.print()
-    console.print(table)
-    console.print()
+    _print_table(f"Agent: {data.get('name', '?')}", rows)
+
+
+def _load_agent_info(yaml_path: Path) -> dict:
+    """Load agent.yaml for `info`, parsing only the metadata header when possible.
+
+    Falls back to parsing the whole file when there is no header marker or the
+    header lacks any of the displayed fields.
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    raw = yaml_path.read_bytes()
+
+    header, marker, _ = raw.partition(_HEADER_MARKER)
+    if marker:
+        try:
+            data = yaml.load(header, Loader=loader)
+        except yaml.YAMLError:
+            data = None
+        if isinstance(data, dict) and all(f in data for f in _INFO_FIELDS):
+            return data
+
+    return yaml.load(raw, Loader=loader)
 
 
 def _prompt(label: str, default: str) -> str:
@@ -182,5 +268,12 @@ def _prompt(label: str, default: str) -> str:
         return default
 
 
+_COMMANDS: dict[str, Callable[[list[str]], None]] = {
+    "new": _cmd_new,
+    "validate": _cmd_validate,
+    "info": _cmd_info,
+}
+
+
 if __name__ == "__main__":
     main()
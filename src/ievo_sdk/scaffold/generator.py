@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from jinja2 import Environment, FileSystemLoader
+from ievo_sdk.scaffold.templates import render_agent_yaml, render_role_md
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
 TEMPLATE_DIR = Path(__file__).parent.parent / "template"
 
+# Custom Jinja2 templates looked up in template_dir; output name drops the .j2 suffix
+RENDERED_TEMPLATES = ("agent.yaml.j2", "ROLE.md.j2")
+
+# Copied verbatim into every agent package
+STATIC_FILES = ("EVOLUTION_LOG.md",)
+STATIC_DIRS = ("memory", "skills")
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentSpec:
     """Specification for a new agent."""
 
@@ -29,15 +44,17 @@ class AgentSpec:
 
     def __post_init__(self) -> None:
         if not self.display_name:
-            self.display_name = self.name.replace("-", " ").title()
+            object.__setattr__(self, "display_name", self.name.replace("-", " ").title())
 
 
-def scaffold_agent(spec: AgentSpec, output_dir: Path) -> Path:
+def scaffold_agent(spec: AgentSpec, output_dir: Path, template_dir: Path | None = None) -> Path:
     """Generate a complete agent package from spec.
 
     Args:
         spec: Agent specification.
         output_dir: Parent directory (agent dir will be created inside).
+        template_dir: Optional directory with custom Jinja2 agent.yaml.j2 and
+            ROLE.md.j2 templates (requires jinja2). Defaults to the bundled ones.
 
     Returns:
         Path to the created agent directory.
@@ -45,11 +62,6 @@ def scaffold_agent(spec: AgentSpec, output_dir: Path) -> Path:
     agent_dir = output_dir / spec.name
     agent_dir.mkdir(parents=True, exist_ok=True)
 
-    env = Environment(
-        loader=FileSystemLoader(str(TEMPLATE_DIR)),
-        keep_trailing_newline=True,
-    )
-
     context = {
         "name": spec.name,
         "display_name": spec.display_name,
@@ -64,32 +76,86 @@ def scaffold_agent(spec: AgentSpec, output_dir: Path) -> Path:
         "dependencies": spec.dependencies or [],
     }
 
-    # Render Jinja2 templates
-    for template_name in ["agent.yaml.j2", "ROLE.md.j2"]:
-        template = env.get_template(template_name)
+    # Render templates
+    if template_dir is None:
+        rendered = (render_agent_yaml(context), render_role_md(context))
+    else:
+        env = _get_env(template_dir)
+        rendered = tuple(env.get_template(n).render(**context) for n in RENDERED_TEMPLATES)
+
+    for template_name, content in zip(RENDERED_TEMPLATES, rendered):
         output_name = template_name.removesuffix(".j2")
-        (agent_dir / output_name).write_text(template.render(**context))
+        _write_file(agent_dir / output_name, content.encode())
 
     # Copy static files
-    _copy_static(agent_dir, "EVOLUTION_LOG.md")
-    _copy_static_dir(agent_dir, "memory")
-    _copy_static_dir(agent_dir, "skills")
+    _write_static(agent_dir)
 
     return agent_dir
 
 
-def _copy_static(agent_dir: Path, filename: str) -> None:
-    """Copy a static template file."""
-    src = TEMPLATE_DIR / filename
-    if src.exists():
-        shutil.copy2(src, agent_dir / filename)
+@cache
+def _get_env(template_dir: Path) -> Environment:
+    """Return the Jinja2 environment for a custom template directory.
 
+    Compiled templates live in Jinja's own cache, which recompiles a template
+    when its source file changes (auto_reload).
+    """
+    try:
+        from jinja2 import Environment, FileSystemLoader
+    except ImportError as e:
+        raise ImportError("Custom templates require Jinja2: pip install 'ievo-sdk[jinja]'") from e
+
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        keep_trailing_newline=True,
+    )
 
-def _copy_static_dir(agent_dir: Path, dirname: str) -> None:
-    """Copy a static template directory."""
-    src = TEMPLATE_DIR / dirname
-    dst = agent_dir / dirname
-    if src.exists():
+
+@lru_cache(maxsize=1)
+def _static_snapshot() -> tuple[tuple[str, bytes], ...]:
+    """Read the static template files into memory once per process.
+
+    Returns (relative path, contents) pairs for STATIC_FILES and every file
+    under STATIC_DIRS.
+    """
+    snapshot: list[tuple[str, bytes]] = []
+    for filename in STATIC_FILES:
+        src = TEMPLATE_DIR / filename
+        if src.is_file():
+            snapshot.append((filename, src.read_bytes()))
+
+    for dirname in STATIC_DIRS:
+        for root, _, filenames in os.walk(TEMPLATE_DIR / dirname):
+            rel_root = os.path.relpath(root, TEMPLATE_DIR)
+            for filename in sorted(filenames):
+                data = Path(root, filename).read_bytes()
+                snapshot.append((os.path.join(rel_root, filename), data))
+
+    return tuple(snapshot)
+
+
+def _write_static(agent_dir: Path) -> None:
+    """Write the static template files, replacing any existing static dirs."""
+    for dirname in STATIC_DIRS:
+        dst = agent_dir / dirname
         if dst.exists():
             shutil.rmtree(dst)
-        shutil.copytree(src, dst)
+
+    created: set[Path] = set()
+    for rel_path, data in _static_snapshot():
+        dst = agent_dir / rel_path
+        if dst.parent not in created:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            created.add(dst.parent)
+        _write_file(dst, data)
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write bytes with one raw open/write/close, skipping the io buffering layers."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
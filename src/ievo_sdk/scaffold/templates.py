@@ -0,0 +1,113 @@
+"""Bundled agent.yaml and ROLE.md templates.
+
+They only need plain value substitution, so they are kept as str.format_map
+strings and rendered without a template engine. Custom Jinja2 templates can
+still be passed to scaffold_agent() through ``template_dir``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+AGENT_YAML = """\
+name: {name}
+version: 0.1.0
+description: "{description}"
+author: "{author}"
+license: MIT
+category: {category}
+
+model:
+  primary: {model}
+  fallback: haiku
+
+dependencies: {dependencies}
+
+# --- end of metadata header: `ievo-sdk info` reads only the block above, keep it intact
+disclosure:
+  l1_meta: agent.yaml
+  l2_instructions: ROLE.md
+  l3_resources:
+    - memory/CONTEXT.md
+    - memory/DECISIONS.md
+    - memory/VOCABULARY.md
+    - memory/HISTORY.md
+
+# hooks:
+#   post_run: "scripts/post_run.sh"
+#   on_error: "scripts/on_error.sh"
+#   on_evolve: "scripts/on_evolve.sh"
+"""
+
+ROLE_MD = """\
+# {display_name}
+
+> {description}
+
+## Identity
+
+You are **{display_name}**, an iEvo agent specialized in {specialty}.
+You operate within the iEvo SDD pipeline and follow the self-evolution protocol.
+
+## Responsibilities
+
+1. **Primary**: {primary_responsibility}
+2. **Quality**: Ensure all outputs meet the quality bar before handoff
+3. **Evolution**: Learn from mistakes via the EVO skill
+
+## Input
+
+You receive:
+- Pipeline conventions from `.ievo/IEVO.md`
+- Project context from `.ievo/memory/CONTEXT.md`
+- Prior decisions from `.ievo/memory/DECISIONS.md`
+- Domain vocabulary from `.ievo/memory/VOCABULARY.md`
+{upstream_section}
+
+## Output
+
+You produce:
+- {primary_output}
+- Updated memory files when you learn new context
+- Evolution log entries when you improve
+
+## Rules
+
+1. **Never assume** — if unclear, ask. Use `QUESTION_TEMPLATE.md` format
+2. **Be explicit** — every output must be traceable to a requirement
+3. **Evolve** — when you make a mistake, run the EVO skill immediately
+4. **One thing well** — focus on your specialty, delegate everything else
+5. **Memory first** — always read memory files before starting work
+
+## Onboarding
+
+On first session in a new project:
+1. Read `.ievo/IEVO.md` for pipeline conventions, then all files in `.ievo/memory/`
+2. If `.ievo/memory/CONTEXT.md` is empty, interview the user to fill it
+3. Scan existing project artifacts for context
+4. Confirm understanding before proceeding
+
+## Quality Checklist
+
+Before completing any task:
+- [ ] Output matches the requirement exactly
+- [ ] No assumptions made without evidence
+- [ ] Memory files updated with new learnings
+- [ ] Ready for downstream agent handoff
+"""
+
+# Inserted into ROLE.md's Input section when an upstream agent is set
+UPSTREAM_SECTION = "\n- Artifacts from upstream agent: **{upstream_agent}**\n"
+
+
+def render_agent_yaml(context: Mapping[str, Any]) -> str:
+    """Render agent.yaml from the scaffold context."""
+    return AGENT_YAML.format_map(context)
+
+
+def render_role_md(context: Mapping[str, Any]) -> str:
+    """Render ROLE.md from the scaffold context."""
+    upstream = context.get("upstream_agent")
+    upstream_section = UPSTREAM_SECTION.format(upstream_agent=upstream) if upstream else ""
+    return ROLE_MD.format_map({**context, "upstream_section": upstream_section})
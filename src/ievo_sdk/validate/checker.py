@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import os
+import re
 from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib.resources import files
 from pathlib import Path
+from typing import Any
 
 import yaml
 
@@ -13,22 +17,54 @@ try:
 except ImportError:
     jsonschema = None  # type: ignore[assignment]
 
-SCHEMA_PATH = Path(__file__).parent.parent.parent.parent / "schemas" / "agent.schema.json"
+# orjson parses the schema several times faster when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# libyaml-backed loader when available, pure-Python fallback otherwise
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shipped inside the package so installed wheels validate against it too
+SCHEMA_PATH = files("ievo_sdk") / "schemas" / "agent.schema.json"
 
 # Required files in a valid agent package
-REQUIRED_FILES = [
+REQUIRED_FILES = (
     "agent.yaml",
     "ROLE.md",
-]
+)
 
-RECOMMENDED_FILES = [
+RECOMMENDED_FILES = (
     "EVOLUTION_LOG.md",
     "memory/CONTEXT.md",
     "memory/DECISIONS.md",
     "memory/VOCABULARY.md",
     "memory/HISTORY.md",
     "skills/evo/SKILL.md",
-]
+)
+
+EVO_SKILL_FILE = "skills/evo/SKILL.md"
+
+
+def _group_by_dir(paths: tuple[str, ...]) -> dict[str, frozenset[str]]:
+    """Group relative file paths by parent directory ("" for the package root)."""
+    groups: dict[str, set[str]] = {}
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        groups.setdefault(parent, set()).add(name)
+    return {parent: frozenset(names) for parent, names in groups.items()}
+
+
+# Expected files by directory, so validation lists each directory exactly once
+_EXPECTED_BY_DIR = _group_by_dir(REQUIRED_FILES + RECOMMENDED_FILES)
+
+_SEMVER_RE = re.compile(r"\A\d+\.\d+\.\d+\Z")
+_NAME_RE = re.compile(r"\A[a-z0-9-]+\Z")
+
+# ROLE.md section keywords, matched case-insensitively without lowercasing a copy
+_RESPONSIBILITIES_RE = re.compile(r"responsibilit|task", re.IGNORECASE)
+_RULES_RE = re.compile(r"rule|constraint", re.IGNORECASE)
 
 
 @dataclass
@@ -74,37 +110,60 @@ def validate_agent(agent_dir: Path) -> ValidationResult:
         result.error(f"Not a directory: {agent_dir}")
         return result
 
-    # 1. Required files
-    for f in REQUIRED_FILES:
-        if not (agent_dir / f).exists():
-            result.error(f"Missing required file: {f}")
+    present = _scan_files(agent_dir)
 
-    if not result.valid:
-        return result
+    # 1. Required files
+    missing_required = [f for f in REQUIRED_FILES if f not in present]
+    for f in missing_required:
+        result.error(f"Missing required file: {f}")
 
     # 2. Schema validation
-    _validate_schema(agent_dir / "agent.yaml", result)
+    if "agent.yaml" not in missing_required:
+        _validate_schema(agent_dir / "agent.yaml", result)
 
     # 3. ROLE.md checks
-    _validate_role(agent_dir / "ROLE.md", result)
+    if "ROLE.md" not in missing_required:
+        _validate_role(agent_dir / "ROLE.md", result)
+
+    if missing_required:
+        return result
 
     # 4. Recommended files
     for f in RECOMMENDED_FILES:
-        if not (agent_dir / f).exists():
+        if f not in present:
             result.warn(f"Missing recommended file: {f}")
 
     # 5. EVO skill
-    evo_skill = agent_dir / "skills" / "evo" / "SKILL.md"
-    if not evo_skill.exists():
+    if EVO_SKILL_FILE not in present:
         result.warn("Missing EVO skill — agent won't self-evolve")
 
     return result
 
 
+def _scan_files(agent_dir: Path) -> set[str]:
+    """Return which REQUIRED_FILES and RECOMMENDED_FILES exist under agent_dir.
+
+    Each directory in _EXPECTED_BY_DIR is listed once with os.scandir, instead
+    of issuing a stat() per file. Paths are joined as plain strings.
+    """
+    base = os.fspath(agent_dir)
+    present: set[str] = set()
+    for parent, names in _EXPECTED_BY_DIR.items():
+        try:
+            with os.scandir(os.path.join(base, parent)) as entries:
+                found = names.intersection(e.name for e in entries if e.is_file())
+        except OSError:
+            # Missing, not a directory, unlistable or a symlink loop: files absent
+            continue
+        prefix = f"{parent}/" if parent else ""
+        present.update(prefix + name for name in found)
+    return present
+
+
 def _validate_schema(yaml_path: Path, result: ValidationResult) -> None:
     """Validate agent.yaml against JSON schema."""
     try:
-        data = yaml.safe_load(yaml_path.read_text())
+        data = yaml.load(yaml_path.read_bytes(), Loader=_YamlLoader)
     except yaml.YAMLError as e:
         result.error(f"Invalid YAML in agent.yaml: {e}")
         return
@@ -129,26 +188,34 @@ def _validate_schema(yaml_path: Path, result: ValidationResult) -> None:
 
     # Version format
     version = data.get("version", "")
-    if version and not _is_semver(version):
+    if version and not _is_semver(str(version)):
         result.error(f"Invalid version format: {version} (must be X.Y.Z)")
 
     # Name format
     name = data.get("name", "")
-    if name and not all(c.isalnum() or c == "-" for c in name):
+    if name and not _NAME_RE.match(str(name)):
         result.error(f"Invalid name: {name} (lowercase alphanumeric and hyphens only)")
 
     # Full schema validation if jsonschema available
-    if jsonschema and SCHEMA_PATH.exists():
-        try:
-            schema = json.loads(SCHEMA_PATH.read_text())
-            jsonschema.validate(data, schema)
-            result.add_info("Schema validation passed")
-        except jsonschema.ValidationError as e:
+    if jsonschema and SCHEMA_PATH.is_file():
+        schema_errors = list(_get_validator().iter_errors(data))
+        for e in schema_errors:
             result.error(f"Schema validation: {e.message}")
+        if not schema_errors:
+            result.add_info("Schema validation passed")
     else:
         result.add_info("jsonschema not available — using basic validation only")
 
 
+@lru_cache(maxsize=1)
+def _get_validator() -> Any:
+    """Load agent.schema.json and build its validator once per process."""
+    schema = _json_loads(SCHEMA_PATH.read_bytes())
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
 def _validate_role(role_path: Path, result: ValidationResult) -> None:
     """Validate ROLE.md content."""
     content = role_path.read_text().strip()
@@ -161,11 +228,10 @@ def _validate_role(role_path: Path, result: ValidationResult) -> None:
         result.warn("ROLE.md should start with a markdown heading")
 
     # Check for key sections
-    lower = content.lower()
-    if "responsibilit" not in lower and "task" not in lower:
+    if not _RESPONSIBILITIES_RE.search(content):
         result.warn("ROLE.md should describe agent responsibilities")
 
-    if "rule" not in lower and "constraint" not in lower:
+    if not _RULES_RE.search(content):
         result.warn("ROLE.md should include rules or constraints")
 
     result.add_info(f"ROLE.md: {len(content)} chars, {content.count('##')} sections")
@@ -173,7 +239,4 @@ def _validate_role(role_path: Path, result: ValidationResult) -> None:
 
 def _is_semver(v: str) -> bool:
     """Check if string is valid semver X.Y.Z."""
-    parts = v.split(".")
-    if len(parts) != 3:
-        return False
-    return all(p.isdigit() for p in parts)
+    return _SEMVER_RE.match(v) is not None
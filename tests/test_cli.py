@@ -0,0 +1,62 @@
+"""Tests for the ievo-sdk CLI."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from ievo_sdk.cli import _load_agent_info, main
+from ievo_sdk.scaffold.generator import AgentSpec, scaffold_agent
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, *args: str) -> None:
+    monkeypatch.setattr(sys, "argv", ["ievo-sdk", *args])
+    main()
+
+
+def test_version(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    _run(monkeypatch, "--version")
+    assert capsys.readouterr().out.startswith("ievo-sdk ")
+
+
+def test_info_plain_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    agent_dir = scaffold_agent(AgentSpec(name="my-agent", model="opus"), tmp_path)
+    _run(monkeypatch, "info", str(agent_dir))
+
+    out = capsys.readouterr().out
+    assert "Agent: my-agent" in out
+    assert "Model         opus → haiku" in out
+    assert "[" not in out  # no leftover Rich markup
+
+
+def test_unknown_command(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit) as exc:
+        _run(monkeypatch, "bogus")
+    assert exc.value.code == 1
+    assert "Unknown command: bogus" in capsys.readouterr().out
+
+
+def test_info_reads_header_only(tmp_path: Path) -> None:
+    agent_dir = scaffold_agent(AgentSpec(name="my-agent"), tmp_path)
+    yaml_path = agent_dir / "agent.yaml"
+    yaml_path.write_text(yaml_path.read_text() + "broken: [unclosed\n")
+
+    data = _load_agent_info(yaml_path)
+    assert data["name"] == "my-agent"
+    assert "disclosure" not in data
+
+
+def test_info_falls_back_to_full_parse(tmp_path: Path) -> None:
+    yaml_path = tmp_path / "agent.yaml"
+    yaml_path.write_text(
+        "name: my-agent\n# --- header without the other fields\n"
+        "version: 0.1.0\ndescription: test\nmodel:\n  primary: sonnet\n"
+    )
+
+    data = _load_agent_info(yaml_path)
+    assert data["version"] == "0.1.0"
+    assert data["model"] == {"primary": "sonnet"}
@@ -1,10 +1,11 @@
 """Tests for agent scaffolding."""
 
+import os
 from pathlib import Path
 
 import pytest
 
-from ievo_sdk.scaffold.generator import AgentSpec, scaffold_agent
+from ievo_sdk.scaffold.generator import TEMPLATE_DIR, AgentSpec, _get_env, scaffold_agent
 
 
 @pytest.fixture
@@ -74,3 +75,69 @@ def test_scaffold_renders_role_md(tmp_output: Path) -> None:
 def test_display_name_auto_generated() -> None:
     spec = AgentSpec(name="code-reviewer")
     assert spec.display_name == "Code Reviewer"
+
+
+def test_display_name_explicit() -> None:
+    spec = AgentSpec(name="code-reviewer", display_name="Reviewer")
+    assert spec.display_name == "Reviewer"
+
+
+def test_scaffold_renders_upstream_agent(tmp_output: Path) -> None:
+    spec = AgentSpec(name="my-agent", upstream_agent="planner")
+    agent_dir = scaffold_agent(spec, tmp_output)
+    assert "Artifacts from upstream agent: **planner**" in (agent_dir / "ROLE.md").read_text()
+
+    spec = AgentSpec(name="other-agent")
+    agent_dir = scaffold_agent(spec, tmp_output)
+    assert "upstream agent" not in (agent_dir / "ROLE.md").read_text()
+
+
+@pytest.fixture
+def custom_templates(tmp_path: Path) -> Path:
+    pytest.importorskip("jinja2")
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    (template_dir / "agent.yaml.j2").write_text(
+        "name: {{ name }}\nversion: 0.1.0\ndescription: custom\nmodel:\n  primary: {{ model }}\n"
+    )
+    (template_dir / "ROLE.md.j2").write_text("# {{ display_name | upper }}\n")
+    return template_dir
+
+
+def test_scaffold_custom_templates(tmp_output: Path, custom_templates: Path) -> None:
+    spec = AgentSpec(name="my-agent", model="haiku")
+    agent_dir = scaffold_agent(spec, tmp_output, template_dir=custom_templates)
+
+    assert "primary: haiku" in (agent_dir / "agent.yaml").read_text()
+    assert (agent_dir / "ROLE.md").read_text() == "# MY AGENT\n"
+    assert (agent_dir / "memory" / "CONTEXT.md").exists()
+
+
+def test_custom_templates_reloaded_on_change(tmp_output: Path, custom_templates: Path) -> None:
+    scaffold_agent(AgentSpec(name="first-agent"), tmp_output, template_dir=custom_templates)
+    env = _get_env(custom_templates)
+
+    role_template = custom_templates / "ROLE.md.j2"
+    role_template.write_text("# {{ name }} v2\n")
+    mtime = role_template.stat().st_mtime + 10
+    os.utime(role_template, (mtime, mtime))
+
+    agent_dir = scaffold_agent(
+        AgentSpec(name="second-agent"), tmp_output, template_dir=custom_templates
+    )
+    assert _get_env(custom_templates) is env
+    assert (agent_dir / "ROLE.md").read_text() == "# second-agent v2\n"
+
+
+def test_scaffold_static_files_match_templates(tmp_output: Path) -> None:
+    agent_dir = scaffold_agent(AgentSpec(name="test-agent"), tmp_output)
+    for rel in ["EVOLUTION_LOG.md", "memory/CONTEXT.md", "skills/evo/SKILL.md"]:
+        assert (agent_dir / rel).read_bytes() == (TEMPLATE_DIR / rel).read_bytes()
+
+
+def test_rescaffold_replaces_static_dirs(tmp_output: Path) -> None:
+    agent_dir = scaffold_agent(AgentSpec(name="test-agent"), tmp_output)
+    (agent_dir / "memory" / "STALE.md").write_text("old")
+    scaffold_agent(AgentSpec(name="test-agent"), tmp_output)
+    assert not (agent_dir / "memory" / "STALE.md").exists()
+    assert (agent_dir / "memory" / "CONTEXT.md").exists()
@@ -1,11 +1,12 @@
 """Tests for agent validation."""
 
+import shutil
 from pathlib import Path
 
 import pytest
 
 from ievo_sdk.scaffold.generator import AgentSpec, scaffold_agent
-from ievo_sdk.validate.checker import validate_agent
+from ievo_sdk.validate.checker import _is_semver, validate_agent
 
 
 @pytest.fixture
@@ -71,3 +72,92 @@ def test_warnings_for_missing_recommended(tmp_path: Path) -> None:
     result = validate_agent(agent_dir)
     assert result.valid  # warnings don't fail
     assert len(result.warnings) > 0
+
+
+def test_warns_for_each_missing_nested_file(valid_agent: Path) -> None:
+    (valid_agent / "memory" / "HISTORY.md").unlink()
+    result = validate_agent(valid_agent)
+    assert result.valid
+    assert result.warnings == ["Missing recommended file: memory/HISTORY.md"]
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [("0.1.0", True), ("10.20.30", True), ("1.0", False), ("1.0.0-rc1", False), ("1.0.0\n", False)],
+)
+def test_is_semver(version: str, expected: bool) -> None:
+    assert _is_semver(version) is expected
+
+
+def test_schema_errors_reported(valid_agent: Path) -> None:
+    yaml_path = valid_agent / "agent.yaml"
+    yaml_path.write_text(yaml_path.read_text().replace("category: community", "category: misc"))
+    result = validate_agent(valid_agent)
+    assert not result.valid
+    assert any(e.startswith("Schema validation:") and "misc" in e for e in result.errors)
+
+
+def test_role_section_keywords_case_insensitive(valid_agent: Path) -> None:
+    (valid_agent / "ROLE.md").write_text(
+        "# Test Agent\n\n## TASKS\n\nDo things well.\n\n## CONSTRAINTS\n\n1. Be good.\n"
+    )
+    result = validate_agent(valid_agent)
+    assert not any("ROLE.md should" in w for w in result.warnings)
+
+    (valid_agent / "ROLE.md").write_text("# Test Agent\n\n" + "Some plain prose. " * 5)
+    result = validate_agent(valid_agent)
+    assert "ROLE.md should describe agent responsibilities" in result.warnings
+    assert "ROLE.md should include rules or constraints" in result.warnings
+
+
+def test_missing_required_files_reported_in_order(tmp_path: Path) -> None:
+    agent_dir = tmp_path / "empty"
+    agent_dir.mkdir()
+    result = validate_agent(agent_dir)
+    assert result.errors == [
+        "Missing required file: agent.yaml",
+        "Missing required file: ROLE.md",
+    ]
+
+
+def test_agent_yaml_decoded_as_utf8(valid_agent: Path) -> None:
+    yaml_path = valid_agent / "agent.yaml"
+    text = yaml_path.read_text(encoding="utf-8")
+    yaml_path.write_bytes(text.replace("A valid test agent", "Agent — ünïcode").encode("utf-8"))
+    result = validate_agent(valid_agent)
+    assert result.valid, result.errors
+
+
+def test_present_required_file_checked_when_other_missing(tmp_path: Path) -> None:
+    agent_dir = tmp_path / "broken"
+    agent_dir.mkdir()
+    (agent_dir / "agent.yaml").write_text(
+        "name: test\nversion: 1.0\ndescription: test\nmodel:\n  primary: sonnet\n"
+    )
+    result = validate_agent(agent_dir)
+    assert "Missing required file: ROLE.md" in result.errors
+    assert "Invalid version format: 1.0 (must be X.Y.Z)" in result.errors
+    assert not result.warnings  # recommended files are skipped for broken packages
+
+
+def test_dangling_symlink_counts_as_missing(valid_agent: Path) -> None:
+    role = valid_agent / "ROLE.md"
+    role.unlink()
+    role.symlink_to(valid_agent / "nowhere.md")
+    result = validate_agent(valid_agent)
+    assert not result.valid
+    assert "Missing required file: ROLE.md" in result.errors
+
+
+def test_symlink_loop_dir_counts_as_missing(valid_agent: Path) -> None:
+    memory = valid_agent / "memory"
+    shutil.rmtree(memory)
+    memory.symlink_to(memory)
+    result = validate_agent(valid_agent)
+    assert result.valid
+    assert [w for w in result.warnings if "memory/" in w] == [
+        "Missing recommended file: memory/CONTEXT.md",
+        "Missing recommended file: memory/DECISIONS.md",
+        "Missing recommended file: memory/VOCABULARY.md",
+        "Missing recommended file: memory/HISTORY.md",
+    ]